@@ -6,10 +6,10 @@ typealias AudioCaptureSessionID = UUID
 
 /// Delegate protocol for audio capture events
 protocol AudioCaptureDelegate: AnyObject {
-    /// Called when audio buffer is ready to send
-    func audioCaptureDidReceiveBuffer(_ buffer: Data, sessionID: AudioCaptureSessionID)
+    /// Called when audio buffer is ready to send, with its amplitude for the visualizer (0.0 - 1.0)
+    func audioCaptureDidReceiveBuffer(_ buffer: Data, amplitude: Float, sessionID: AudioCaptureSessionID)
     
-    /// Called with amplitude value for visualizer (0.0 - 1.0)
+    /// Called with amplitude value for visualizer (0.0 - 1.0) when a buffer produced no audio to send
     func audioCaptureDidUpdateAmplitude(_ amplitude: Float, sessionID: AudioCaptureSessionID)
     
     /// Called when an error occurs
@@ -41,12 +41,18 @@ class AudioCaptureManager: AudioCapturing {
     weak var delegate: AudioCaptureDelegate?
     var inputDevicesDidChange: (() -> Void)?
     
+    /// Kept between sessions so the next recording skips engine and device setup
     private var audioEngine: AVAudioEngine?
+    /// Set when the input device selection or device list changes, so the kept
+    /// engine is rebuilt against the current device before the next recording
+    private var audioEngineNeedsRebuild = false
     private var isRecording = false
     private var activeSessionID: AudioCaptureSessionID?
     private let defaults: UserDefaults
     private let notificationCenter: NotificationCenter
     private var defaultInputDeviceListenerBlock: AudioObjectPropertyListenerBlock?
+    /// Serial queue for format conversion so the tap callback returns immediately
+    private let processingQueue = DispatchQueue(label: "kotaeba.audio.processing", qos: .userInitiated)
     
     // Target format for Whisper
     private let targetSampleRate: Double = Constants.Audio.sampleRate
@@ -97,18 +103,24 @@ class AudioCaptureManager: AudioCapturing {
         }
 
         let sessionID = AudioCaptureSessionID()
-        
-        audioEngine = AVAudioEngine()
-        guard let audioEngine = audioEngine else {
-            throw AudioError.engineCreationFailed
+
+        if audioEngineNeedsRebuild {
+            discardAudioEngine()
         }
 
-        do {
-            try configureSelectedInputDevice(on: audioEngine)
-        } catch {
-            audioEngine.stop()
-            self.audioEngine = nil
-            throw error
+        let audioEngine: AVAudioEngine
+        if let existingEngine = self.audioEngine {
+            audioEngine = existingEngine
+        } else {
+            audioEngine = AVAudioEngine()
+            do {
+                try configureSelectedInputDevice(on: audioEngine)
+            } catch {
+                audioEngine.stop()
+                throw error
+            }
+            self.audioEngine = audioEngine
+            observeConfigurationChanges(of: audioEngine)
         }
         
         let inputNode = audioEngine.inputNode
@@ -123,27 +135,33 @@ class AudioCaptureManager: AudioCapturing {
             channels: targetChannels,
             interleaved: true
         ) else {
-            audioEngine.stop()
-            self.audioEngine = nil
+            discardAudioEngine()
             throw AudioError.formatCreationFailed
         }
         
         // Create converter
         guard let converter = AVAudioConverter(from: inputFormat, to: outputFormat) else {
-            audioEngine.stop()
-            self.audioEngine = nil
+            discardAudioEngine()
             throw AudioError.converterCreationFailed
         }
         
-        // Install tap on input node
+        // The formats are fixed for the whole session, so resolve the
+        // conversion parameters once instead of on every tapped buffer.
+        let conversion = AudioConversionContext(
+            converter: converter,
+            outputFormat: outputFormat,
+            sampleRateRatio: outputFormat.sampleRate / inputFormat.sampleRate,
+            bytesPerFrame: Int(outputFormat.streamDescription.pointee.mBytesPerFrame)
+        )
+
+        // Install tap on input node. Conversion is handed off to the processing
+        // queue so capture never waits on resampling or delegate delivery.
         let bufferSize: AVAudioFrameCount = AVAudioFrameCount(Constants.Audio.bufferSize)
+        let processingQueue = self.processingQueue
         inputNode.installTap(onBus: 0, bufferSize: bufferSize, format: inputFormat) { [weak self] buffer, time in
-            self?.processAudioBuffer(
-                buffer,
-                converter: converter,
-                outputFormat: outputFormat,
-                sessionID: sessionID
-            )
+            processingQueue.async {
+                self?.processAudioBuffer(buffer, conversion: conversion, sessionID: sessionID)
+            }
         }
         
         // Start engine
@@ -151,9 +169,7 @@ class AudioCaptureManager: AudioCapturing {
         do {
             try audioEngine.start()
         } catch {
-            inputNode.removeTap(onBus: 0)
-            audioEngine.stop()
-            self.audioEngine = nil
+            discardAudioEngine()
             activeSessionID = nil
             isRecording = false
             throw error
@@ -166,44 +182,68 @@ class AudioCaptureManager: AudioCapturing {
     }
     
     /// Stop capturing audio
+    ///
+    /// The stopped engine is kept for the next session; it is only torn down
+    /// when the input device changes or a start fails.
     func stopRecording() {
-        guard isRecording || audioEngine != nil || activeSessionID != nil else { return }
+        guard isRecording || activeSessionID != nil else { return }
         
         audioEngine?.inputNode.removeTap(onBus: 0)
         audioEngine?.stop()
-        audioEngine = nil
         
         isRecording = false
         activeSessionID = nil
         Log.audio.info("Recording stopped")
     }
+
+    private func discardAudioEngine() {
+        if let audioEngine {
+            notificationCenter.removeObserver(
+                self,
+                name: .AVAudioEngineConfigurationChange,
+                object: audioEngine
+            )
+        }
+        audioEngine?.inputNode.removeTap(onBus: 0)
+        audioEngine?.stop()
+        audioEngine = nil
+        audioEngineNeedsRebuild = false
+    }
     
     // MARK: - Audio Processing
     
     private func processAudioBuffer(
         _ inputBuffer: AVAudioPCMBuffer,
-        converter: AVAudioConverter,
-        outputFormat: AVAudioFormat,
+        conversion: AudioConversionContext,
         sessionID: AudioCaptureSessionID
     ) {
         guard isRecording, activeSessionID == sessionID else { return }
 
         // Calculate amplitude for visualizer (from input buffer)
         let amplitude = calculateAmplitude(from: inputBuffer)
-        delegate?.audioCaptureDidUpdateAmplitude(amplitude, sessionID: sessionID)
+
+        guard let data = convert(inputBuffer, conversion: conversion) else {
+            delegate?.audioCaptureDidUpdateAmplitude(amplitude, sessionID: sessionID)
+            return
+        }
         
-        // Convert to output format
-        let ratio = outputFormat.sampleRate / inputBuffer.format.sampleRate
-        let outputFrameCapacity = AVAudioFrameCount(Double(inputBuffer.frameLength) * ratio)
+        guard isRecording, activeSessionID == sessionID else { return }
+        // Deliver audio and amplitude together: one delegate hop per buffer.
+        delegate?.audioCaptureDidReceiveBuffer(data, amplitude: amplitude, sessionID: sessionID)
+    }
+
+    /// Convert a tapped buffer to 16kHz mono Int16 PCM bytes
+    private func convert(_ inputBuffer: AVAudioPCMBuffer, conversion: AudioConversionContext) -> Data? {
+        let outputFrameCapacity = AVAudioFrameCount(Double(inputBuffer.frameLength) * conversion.sampleRateRatio)
         
-        guard let outputBuffer = AVAudioPCMBuffer(pcmFormat: outputFormat, frameCapacity: outputFrameCapacity) else {
-            return
+        guard let outputBuffer = conversion.reusableOutputBuffer(frameCapacity: outputFrameCapacity) else {
+            return nil
         }
         
         var error: NSError?
         var hasData = true
         
-        let status = converter.convert(to: outputBuffer, error: &error) { inNumPackets, outStatus in
+        let status = conversion.converter.convert(to: outputBuffer, error: &error) { inNumPackets, outStatus in
             if hasData {
                 outStatus.pointee = .haveData
                 hasData = false
@@ -216,19 +256,16 @@ class AudioCaptureManager: AudioCapturing {
         
         guard status != .error, error == nil else {
             Log.audio.error("Conversion error: \(error?.localizedDescription ?? "unknown")")
-            return
+            return nil
         }
         
         // Extract Int16 data
-        guard let int16Data = outputBuffer.int16ChannelData else { return }
+        guard let int16Data = outputBuffer.int16ChannelData else { return nil }
         
         let frameLength = Int(outputBuffer.frameLength)
-        guard frameLength > 0 else { return }
-        
-        let data = Data(bytes: int16Data[0], count: frameLength * 2)  // 2 bytes per Int16
+        guard frameLength > 0 else { return nil }
         
-        guard isRecording, activeSessionID == sessionID else { return }
-        delegate?.audioCaptureDidReceiveBuffer(data, sessionID: sessionID)
+        return Data(bytes: int16Data[0], count: frameLength * conversion.bytesPerFrame)
     }
     
     /// Calculate RMS amplitude from audio buffer (0.0 - 1.0)
@@ -267,6 +304,7 @@ class AudioCaptureManager: AudioCapturing {
 
         defaults.set(normalizedID, forKey: Constants.UserDefaultsKeys.selectedAudioDevice)
         stopRecording()
+        audioEngineNeedsRebuild = true
     }
 
     /// Get list of available audio input devices plus the explicit System Default option.
@@ -308,11 +346,33 @@ class AudioCaptureManager: AudioCapturing {
         observeDefaultInputDeviceChanges()
     }
 
+    private func observeConfigurationChanges(of audioEngine: AVAudioEngine) {
+        notificationCenter.addObserver(
+            self,
+            selector: #selector(audioEngineConfigurationDidChange(_:)),
+            name: .AVAudioEngineConfigurationChange,
+            object: audioEngine
+        )
+    }
+
     @objc private func audioDevicesDidChange() {
         handleAudioDevicesDidChange(defaultInputChanged: false)
     }
 
+    @objc private func audioEngineConfigurationDidChange(_ notification: Notification) {
+        // The hardware format or route changed under the kept engine. The
+        // notification can arrive on any thread, while recording state is
+        // only touched on the main thread.
+        let changedEngine = notification.object as AnyObject?
+        DispatchQueue.main.async { [weak self] in
+            guard let self, let changedEngine, changedEngine === self.audioEngine else { return }
+            self.audioEngineNeedsRebuild = true
+        }
+    }
+
     private func handleAudioDevicesDidChange(defaultInputChanged: Bool) {
+        audioEngineNeedsRebuild = true
+
         let selectedID = selectedInputDeviceID()
         let availableDevices = refreshAvailableInputDevices()
         let selectedDeviceIsUnavailable = selectedID != AudioInputDevice.systemDefaultID &&
@@ -473,6 +533,39 @@ class AudioCaptureManager: AudioCapturing {
     }
 }
 
+// MARK: - Audio Conversion
+
+/// Per-session conversion state resolved once when recording starts
+///
+/// Only touched from the serial processing queue. The output buffer is reused
+/// across tapped buffers, since each conversion copies its frames into `Data`.
+private final class AudioConversionContext {
+    let converter: AVAudioConverter
+    let outputFormat: AVAudioFormat
+    let sampleRateRatio: Double
+    let bytesPerFrame: Int
+    private var outputBuffer: AVAudioPCMBuffer?
+
+    init(converter: AVAudioConverter, outputFormat: AVAudioFormat, sampleRateRatio: Double, bytesPerFrame: Int) {
+        self.converter = converter
+        self.outputFormat = outputFormat
+        self.sampleRateRatio = sampleRateRatio
+        self.bytesPerFrame = bytesPerFrame
+    }
+
+    /// Return an empty output buffer holding at least `frameCapacity` frames,
+    /// allocating only when a larger input buffer arrives
+    func reusableOutputBuffer(frameCapacity: AVAudioFrameCount) -> AVAudioPCMBuffer? {
+        if let outputBuffer, outputBuffer.frameCapacity >= frameCapacity {
+            outputBuffer.frameLength = 0
+            return outputBuffer
+        }
+
+        outputBuffer = AVAudioPCMBuffer(pcmFormat: outputFormat, frameCapacity: frameCapacity)
+        return outputBuffer
+    }
+}
+
 // MARK: - Audio Errors
 
 enum AudioError: LocalizedError {
@@ -91,6 +91,7 @@ class AppStateManager: ObservableObject {
     private let huggingFaceTokenProvider: @MainActor () -> String?
     private var permissionRefreshTask: Task<Void, Never>?
     private var pendingWebSocketDisconnectTask: Task<Void, Never>?
+    private var didShutDownForTermination = false
     private var activeAudioSessionID: AudioCaptureSessionID?
     
     // MARK: - Session Tracking
@@ -423,17 +424,35 @@ class AppStateManager: ObservableObject {
     }
     
     func stopServer() {
+        tearDownSessionsForServerStop()
+        serverManager?.stop()
+        serverStartupStage = nil
+        serverPortConflictRecoveryMessage = nil
+        state = .idle
+        Log.server.info("Server stopped")
+    }
+
+    /// Restart the server, waiting for the old process to exit before the new
+    /// launch so its deferred teardown cannot race with the replacement server.
+    private func restartServer() async {
+        tearDownSessionsForServerStop()
+        prepareForServerStart()
+        await serverManager?.stopAndWait(timeout: 2.0)
+
+        do {
+            try await performServerStart()
+        } catch {
+            await handleServerStartFailure(error)
+        }
+    }
+
+    private func tearDownSessionsForServerStop() {
         cancelPendingWebSocketDisconnect()
         clearRecordingModePrompt()
         stopAudioCapture()
         finalizePendingRecordingSessionIfNeeded()
         disconnectCurrentWebSocket()
         resetRecordingSession(clearCompletedTranscription: true)
-        serverManager?.stop()
-        serverStartupStage = nil
-        serverPortConflictRecoveryMessage = nil
-        state = .idle
-        Log.server.info("Server stopped")
     }
     
     // MARK: - Recording Control
@@ -477,6 +496,7 @@ class AppStateManager: ObservableObject {
         
         // Stop audio first so no new buffers are sent during final-transcript grace.
         stopAudioCapture()
+        webSocketClient?.flushAudio()
 
         pendingSessionCompletedAt = Date()
         if webSocketClient != nil {
@@ -804,8 +824,7 @@ class AppStateManager: ObservableObject {
         // If server is running, restart with new model
         if state == .serverRunning, modelDownloadStatus == .downloaded {
             Log.server.info("Restarting server with new model: \(model.name)")
-            stopServer()
-            await startServer()
+            await restartServer()
         }
 
         if wasActive {
@@ -867,8 +886,7 @@ class AppStateManager: ObservableObject {
 
             if state == .serverRunning {
                 Log.server.info("Restarting server with custom model: \(model.name)")
-                stopServer()
-                await startServer()
+                await restartServer()
             }
 
             return true
@@ -1026,6 +1044,9 @@ class AppStateManager: ObservableObject {
     // MARK: - Shutdown
     
     func shutdown() {
+        // applicationWillTerminate follows the awaited termination shutdown;
+        // tearing everything down a second time would only repeat the work.
+        guard !didShutDownForTermination else { return }
         permissionRefreshTask?.cancel()
         cancelPendingWebSocketDisconnect()
         stopRecording()
@@ -1047,6 +1068,7 @@ class AppStateManager: ObservableObject {
         hotkeyManager?.stop()
         isHotkeyActive = false
         state = .idle
+        didShutDownForTermination = true
     }
 }
 
@@ -1147,12 +1169,13 @@ extension AppStateManager: WebSocketClientDelegate {
 
 extension AppStateManager: AudioCaptureDelegate {
     
-    nonisolated func audioCaptureDidReceiveBuffer(_ buffer: Data, sessionID: AudioCaptureSessionID) {
+    nonisolated func audioCaptureDidReceiveBuffer(_ buffer: Data, amplitude: Float, sessionID: AudioCaptureSessionID) {
         Task { @MainActor in
             guard state == .recording, activeAudioSessionID == sessionID else {
                 Log.audio.debug("Ignoring audio buffer from stale capture session")
                 return
             }
+            audioAmplitude = amplitude
             webSocketClient?.sendAudioData(buffer)
         }
     }
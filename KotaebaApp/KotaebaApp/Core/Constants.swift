@@ -66,6 +66,11 @@ enum Constants {
         static let channels: UInt32 = 1
         static let bufferSize: UInt32 = 1600  // 100ms at 16kHz
         static let format = "pcmInt16"
+        static let bytesPerSample = 2  // Int16 PCM
+        static let sendBatchDuration: TimeInterval = 0.2
+        static var sendBatchByteCount: Int {
+            Int(sampleRate * sendBatchDuration) * Int(channels) * bytesPerSample
+        }
     }
 
     // MARK: - Models
@@ -0,0 +1,46 @@
+import Foundation
+
+/// Coalesces small PCM buffers into larger WebSocket frames
+///
+/// Each capture callback only carries a few dozen milliseconds of audio, so
+/// sending them one by one costs a frame header, a send completion, and a
+/// network-queue wakeup per buffer. The batcher accumulates buffers into a
+/// pending `Data` reserved at `threshold` bytes and hands it back as a batch
+/// once that many bytes are queued, starting a fresh reservation for the next.
+struct AudioSendBatcher {
+    let threshold: Int
+    private var pending: Data
+
+    init(threshold: Int = Constants.Audio.sendBatchByteCount) {
+        self.threshold = max(1, threshold)
+        self.pending = Data(capacity: self.threshold)
+    }
+
+    var pendingByteCount: Int {
+        pending.count
+    }
+
+    /// Append a buffer and return a batch when the threshold is reached
+    mutating func append(_ data: Data) -> Data? {
+        pending.append(data)
+        guard pending.count >= threshold else { return nil }
+        return takePending()
+    }
+
+    /// Return any buffered audio that has not been sent yet
+    mutating func flush() -> Data? {
+        guard !pending.isEmpty else { return nil }
+        return takePending()
+    }
+
+    /// Drop buffered audio without sending it
+    mutating func reset() {
+        pending.removeAll(keepingCapacity: true)
+    }
+
+    private mutating func takePending() -> Data {
+        let batch = pending
+        pending = Data(capacity: threshold)
+        return batch
+    }
+}
@@ -1,5 +1,13 @@
 import Foundation
 
+// MARK: - Coding
+
+/// JSON coders shared by every WebSocket frame instead of being rebuilt per message
+enum MessageCoding {
+    static let encoder = JSONEncoder()
+    static let decoder = JSONDecoder()
+}
+
 // MARK: - Client → Server Messages
 
 /// Configuration sent to server when connection is established
@@ -98,29 +106,50 @@ enum ServerMessage {
     
     /// Parse a JSON string into a ServerMessage
     init(from jsonString: String) {
-        guard let data = jsonString.data(using: .utf8) else {
-            self = .unknown(jsonString)
-            return
-        }
-        
-        // Try parsing as transcription first (has "text" field)
-        if let transcription = try? JSONDecoder().decode(ServerTranscription.self, from: data) {
-            self = .transcription(transcription)
-            return
-        }
+        self.init(from: Data(jsonString.utf8), rawText: jsonString)
+    }
+
+    /// Parse UTF-8 encoded JSON bytes into a ServerMessage
+    init(from data: Data) {
+        self.init(from: data, rawText: nil)
+    }
 
-        if let error = try? JSONDecoder().decode(ServerErrorMessage.self, from: data) {
-            self = .error(error)
+    private init(from data: Data, rawText: String?) {
+        guard let payload = try? MessageCoding.decoder.decode(ServerMessagePayload.self, from: data),
+              let message = payload.message else {
+            self = .unknown(rawText ?? String(decoding: data, as: UTF8.self))
             return
         }
-        
-        // Try parsing as status (has "status" field)
-        if let status = try? JSONDecoder().decode(ServerStatus.self, from: data) {
-            self = .status(status)
-            return
+
+        self = message
+    }
+}
+
+/// Decodes a server frame in a single pass, choosing the message type from
+/// the discriminating key instead of attempting each type in turn.
+private struct ServerMessagePayload: Decodable {
+    let message: ServerMessage?
+
+    private enum DiscriminatorKeys: String, CodingKey {
+        case text
+        case error
+        case status
+    }
+
+    init(from decoder: Decoder) throws {
+        let container = try decoder.container(keyedBy: DiscriminatorKeys.self)
+
+        // Precedence matches the server contract: transcriptions carry "text",
+        // errors carry "error", and status updates carry "status". A frame
+        // that fails a higher-priority decode falls through to the next key.
+        if container.contains(.text), let transcription = try? ServerTranscription(from: decoder) {
+            message = .transcription(transcription)
+        } else if container.contains(.error), let error = try? ServerErrorMessage(from: decoder) {
+            message = .error(error)
+        } else if container.contains(.status), let status = try? ServerStatus(from: decoder) {
+            message = .status(status)
+        } else {
+            message = nil
         }
-        
-        // Unknown message format
-        self = .unknown(jsonString)
     }
 }
@@ -8,6 +8,7 @@ protocol WebSocketClienting: AnyObject {
     func disconnect()
     func sendConfiguration(_ config: ClientConfig)
     func sendAudioData(_ data: Data)
+    func flushAudio()
     func sendText(_ text: String)
 }
 
@@ -35,6 +36,7 @@ class WebSocketClient: NSObject, WebSocketClienting {
     private let serverURL: URL
     private var isConnected = false
     private var hasReportedDisconnect = false
+    private var audioBatcher = AudioSendBatcher()
     
     // MARK: - Initialization
     
@@ -42,7 +44,10 @@ class WebSocketClient: NSObject, WebSocketClienting {
         self.serverURL = serverURL
         super.init()
         
-        let config = URLSessionConfiguration.default
+        // The stream is a short-lived local connection: an ephemeral session
+        // skips disk-backed cookie, cache, and credential storage entirely.
+        let config = URLSessionConfiguration.ephemeral
+        config.urlCache = nil
         config.timeoutIntervalForRequest = 30
         config.timeoutIntervalForResource = 300
         self.session = URLSession(configuration: config, delegate: self, delegateQueue: .main)
@@ -69,6 +74,7 @@ class WebSocketClient: NSObject, WebSocketClienting {
     /// Disconnect from the WebSocket server
     func disconnect() {
         hasReportedDisconnect = true
+        audioBatcher.reset()
         let task = webSocketTask
         webSocketTask = nil
         isConnected = false
@@ -81,13 +87,13 @@ class WebSocketClient: NSObject, WebSocketClienting {
     
     /// Send configuration to server
     func sendConfiguration(_ config: ClientConfig) {
-        guard let data = try? JSONEncoder().encode(config),
-              let jsonString = String(data: data, encoding: .utf8) else {
+        guard let data = try? MessageCoding.encoder.encode(config) else {
             Log.websocket.error("Failed to encode config")
             return
         }
         
-        let message = URLSessionWebSocketTask.Message.string(jsonString)
+        // JSONEncoder always emits UTF-8, so skip the validating String(data:encoding:) path.
+        let message = URLSessionWebSocketTask.Message.string(String(decoding: data, as: UTF8.self))
         webSocketTask?.send(message) { error in
             if let error = error {
                 Log.websocket.error("Config send error: \(error)")
@@ -97,8 +103,19 @@ class WebSocketClient: NSObject, WebSocketClienting {
         }
     }
     
-    /// Send audio data (raw PCM bytes)
+    /// Queue audio data (raw PCM bytes), sending once a full batch is buffered
     func sendAudioData(_ data: Data) {
+        guard let batch = audioBatcher.append(data) else { return }
+        sendAudioBatch(batch)
+    }
+
+    /// Send any audio still waiting in the current batch
+    func flushAudio() {
+        guard let batch = audioBatcher.flush() else { return }
+        sendAudioBatch(batch)
+    }
+
+    private func sendAudioBatch(_ data: Data) {
         let message = URLSessionWebSocketTask.Message.data(data)
         webSocketTask?.send(message) { error in
             if let error = error {
@@ -142,34 +159,39 @@ class WebSocketClient: NSObject, WebSocketClienting {
         switch message {
         case .string(let text):
             Log.websocket.debug("Received message: \(text.prefix(200))")
-            let serverMessage = ServerMessage(from: text)
-            
-            switch serverMessage {
-            case .transcription(let transcription):
-                Log.websocket.debug("Parsed transcription: \"\(transcription.text)\" (partial: \(transcription.isPartial))")
-                delegate?.webSocketDidReceiveTranscription(self, transcription: transcription)
-                
-            case .status(let status):
-                Log.websocket.info("Status: \(status.status) - \(status.message)")
-                delegate?.webSocketDidReceiveStatus(self, status: status)
-
-            case .error(let error):
-                Log.websocket.error("Server error: \(error.error)")
-                reportDisconnect(error: WebSocketClientError.server(error.error))
-                webSocketTask?.cancel(with: .internalServerError, reason: error.error.data(using: .utf8))
-                
-            case .unknown(let raw):
-                Log.websocket.warning("Unknown message format: \(raw.prefix(100))...")
-            }
+            handleServerMessage(ServerMessage(from: text))
             
         case .data(let data):
-            Log.websocket.debug("Received binary data: \(data.count) bytes")
+            // Binary frames carry the same JSON payloads; decode the bytes
+            // directly instead of round-tripping them through a String.
+            Log.websocket.debug("Received binary message: \(data.count) bytes")
+            handleServerMessage(ServerMessage(from: data))
             
         @unknown default:
             Log.websocket.warning("Unknown message type")
         }
     }
 
+    private func handleServerMessage(_ serverMessage: ServerMessage) {
+        switch serverMessage {
+        case .transcription(let transcription):
+            Log.websocket.debug("Parsed transcription: \"\(transcription.text)\" (partial: \(transcription.isPartial))")
+            delegate?.webSocketDidReceiveTranscription(self, transcription: transcription)
+            
+        case .status(let status):
+            Log.websocket.info("Status: \(status.status) - \(status.message)")
+            delegate?.webSocketDidReceiveStatus(self, status: status)
+
+        case .error(let error):
+            Log.websocket.error("Server error: \(error.error)")
+            reportDisconnect(error: WebSocketClientError.server(error.error))
+            webSocketTask?.cancel(with: .internalServerError, reason: error.error.data(using: .utf8))
+            
+        case .unknown(let raw):
+            Log.websocket.warning("Unknown message format: \(raw.prefix(100))...")
+        }
+    }
+
     private func reportDisconnect(error: Error?) {
         guard !hasReportedDisconnect else { return }
         hasReportedDisconnect = true
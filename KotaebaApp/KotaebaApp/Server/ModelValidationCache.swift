@@ -0,0 +1,119 @@
+import Foundation
+
+/// Identifies the runtime and model files a startup validation ran against
+///
+/// A validation stays valid while the Python runtime's installed packages and
+/// the model's Hugging Face cache entry are unchanged, so a fingerprint is the
+/// runtime path plus the modification dates of those two directories.
+struct ModelValidationFingerprint: Codable, Equatable {
+    let pythonPath: String
+    let runtimeModifiedAt: Date?
+    let modelModifiedAt: Date
+
+    /// Build a fingerprint, or `nil` when the model is not in the local cache
+    static func make(
+        pythonURL: URL,
+        modelCacheURL: URL,
+        fileManager: FileManager = .default
+    ) -> ModelValidationFingerprint? {
+        // Downloading a new revision touches snapshots/, so prefer it over the
+        // top-level model directory when present.
+        let snapshotsURL = modelCacheURL.appendingPathComponent("snapshots")
+        guard let modelModifiedAt = modificationDate(of: snapshotsURL, fileManager: fileManager)
+            ?? modificationDate(of: modelCacheURL, fileManager: fileManager) else {
+            return nil
+        }
+
+        return ModelValidationFingerprint(
+            pythonPath: pythonURL.path,
+            runtimeModifiedAt: runtimeModificationDate(pythonURL: pythonURL, fileManager: fileManager),
+            modelModifiedAt: modelModifiedAt
+        )
+    }
+
+    /// Modification date of the runtime's site-packages, falling back to the interpreter
+    private static func runtimeModificationDate(pythonURL: URL, fileManager: FileManager) -> Date? {
+        let libURL = pythonURL
+            .deletingLastPathComponent()
+            .deletingLastPathComponent()
+            .appendingPathComponent("lib")
+        let pythonDirectories = (try? fileManager.contentsOfDirectory(atPath: libURL.path))?
+            .filter { $0.hasPrefix("python") }
+            .sorted() ?? []
+
+        let sitePackagesDates = pythonDirectories.compactMap { directory in
+            modificationDate(
+                of: libURL.appendingPathComponent(directory).appendingPathComponent("site-packages"),
+                fileManager: fileManager
+            )
+        }
+
+        return sitePackagesDates.max() ?? modificationDate(of: pythonURL, fileManager: fileManager)
+    }
+
+    private static func modificationDate(of url: URL, fileManager: FileManager) -> Date? {
+        (try? fileManager.attributesOfItem(atPath: url.path))?[.modificationDate] as? Date
+    }
+}
+
+/// Remembers which models already passed the `load_model` startup validation
+///
+/// Entries persist in the support directory so a relaunch with an unchanged
+/// runtime and model cache can skip spawning Python to load the model twice.
+final class ModelValidationCache {
+    private let fileURL: URL
+    private var entries: [String: ModelValidationFingerprint]?
+
+    init(fileURL: URL = Constants.supportDirectory.appendingPathComponent("model-validation-cache.json")) {
+        self.fileURL = fileURL
+    }
+
+    func isValidated(_ modelIdentifier: String, fingerprint: ModelValidationFingerprint?) -> Bool {
+        guard let fingerprint else { return false }
+        return loadedEntries()[modelIdentifier] == fingerprint
+    }
+
+    func record(_ modelIdentifier: String, fingerprint: ModelValidationFingerprint?) {
+        guard let fingerprint else { return }
+        var updatedEntries = loadedEntries()
+        updatedEntries[modelIdentifier] = fingerprint
+        entries = updatedEntries
+        persist(updatedEntries)
+    }
+
+    func invalidate(_ modelIdentifier: String) {
+        var updatedEntries = loadedEntries()
+        guard updatedEntries.removeValue(forKey: modelIdentifier) != nil else { return }
+        entries = updatedEntries
+        persist(updatedEntries)
+    }
+
+    private func loadedEntries() -> [String: ModelValidationFingerprint] {
+        if let entries {
+            return entries
+        }
+
+        let loaded: [String: ModelValidationFingerprint]
+        if let data = try? Data(contentsOf: fileURL),
+           let decoded = try? JSONDecoder().decode([String: ModelValidationFingerprint].self, from: data) {
+            loaded = decoded
+        } else {
+            loaded = [:]
+        }
+        entries = loaded
+        return loaded
+    }
+
+    private func persist(_ entries: [String: ModelValidationFingerprint]) {
+        do {
+            try FileManager.default.createDirectory(
+                at: fileURL.deletingLastPathComponent(),
+                withIntermediateDirectories: true
+            )
+            let data = try JSONEncoder().encode(entries)
+            try data.write(to: fileURL, options: .atomic)
+        } catch {
+            Log.server.warning("Could not persist model validation cache: \(error.localizedDescription)")
+        }
+    }
+}
@@ -36,6 +36,12 @@ class ServerManager {
     private var healthCheckTimer: Timer?
     private let serverMetadataURL = Constants.supportDirectory.appendingPathComponent("server-process.json")
     private var isStopping = false
+    /// Bumped by every start and stop so a deferred stop cleanup only runs
+    /// while no later start or stop has taken over the tracked server state.
+    private var lifecycleGeneration = 0
+    /// Models that already loaded successfully against the current runtime and
+    /// model cache, so restarts and relaunches do not load them twice.
+    private let validationCache = ModelValidationCache()
     
     var unexpectedExitHandler: (@MainActor (String) -> Void)?
     private(set) var isRunning = false
@@ -44,13 +50,16 @@ class ServerManager {
 
     /// Start the mlx_audio.server subprocess
     /// Runs a startup-time model validation before launching the server so model
-    /// failures are discovered before the first hotkey/WebSocket session.
+    /// failures are discovered before the first hotkey/WebSocket session. Models
+    /// that already validated against an unchanged runtime and model cache are
+    /// not loaded a second time.
     func start(model: String, progressHandler: ServerStartupProgressHandler? = nil) async throws {
         guard !isRunning else {
             throw ServerError.alreadyRunning
         }
 
         isStopping = false
+        lifecycleGeneration += 1
         await MainActor.run {
             progressHandler?(.preparingRuntime)
         }
@@ -62,6 +71,10 @@ class ServerManager {
         )
 
         try await cleanupStaleOwnedServerIfNeeded()
+        // A server stopped just before this start has been reaped above; drop
+        // its handles now so a pre-launch failure below cannot leave a later
+        // stop() signalling a dead (and possibly reused) process group.
+        cleanup()
 
         // If something is already answering on the configured port, starting a
         // second server will fail with "address already in use" and we can end
@@ -77,10 +90,14 @@ class ServerManager {
             throw ServerError.setupRequired
         }
 
-        await MainActor.run {
-            progressHandler?(.validatingModel)
+        if validationCache.isValidated(model, fingerprint: validationFingerprint(for: model, pythonURL: pythonURL)) {
+            Log.server.info("Skipping startup validation for already validated model '\(model)'")
+        } else {
+            await MainActor.run {
+                progressHandler?(.validatingModel)
+            }
+            try await validateModelStartup(modelIdentifier: model, pythonURL: pythonURL)
         }
-        try await validateModelStartup(modelIdentifier: model, pythonURL: pythonURL)
 
         let process = Process()
         process.executableURL = pythonURL
@@ -94,7 +111,7 @@ class ServerManager {
         try? FileManager.default.createDirectory(at: logsDir, withIntermediateDirectories: true)
 
         // Launch through a tiny Python trampoline that creates a dedicated
-        // session/process group before exec'ing mlx_audio.server. That gives
+        // session/process group before running mlx_audio.server. That gives
         // us a stable process group we can terminate as one unit on shutdown.
         process.arguments = serverLaunchArguments(logDirectory: logsDir)
         process.environment = ServerEnvironment.build(model: model)
@@ -104,14 +121,21 @@ class ServerManager {
         process.standardOutput = outputPipe
         process.standardError = outputPipe
 
-        // Log server output in background
+        // Log server output in background. Each read is forwarded as one log
+        // entry straight from the handler's queue; Log is thread-safe, so there
+        // is no need to hop to the main actor for every chunk of output.
         outputPipe.fileHandleForReading.readabilityHandler = { handle in
             let data = handle.availableData
-            if let output = String(data: data, encoding: .utf8), !output.isEmpty {
-                let message = output.trimmingCharacters(in: .whitespacesAndNewlines)
-                Task { @MainActor in
-                    Log.server.info(message)
-                }
+            guard !data.isEmpty else {
+                // EOF: the server closed its output, stop polling the pipe.
+                handle.readabilityHandler = nil
+                return
+            }
+
+            let message = String(decoding: data, as: UTF8.self)
+                .trimmingCharacters(in: .whitespacesAndNewlines)
+            if !message.isEmpty {
+                Log.server.info(message)
             }
         }
 
@@ -156,6 +180,9 @@ class ServerManager {
             // Start health monitoring
             startHealthMonitoring()
         } catch {
+            // Re-validate next time so a broken model surfaces the detailed
+            // validation error instead of a bare startup timeout.
+            validationCache.invalidate(model)
             terminateTrackedServer(force: true)
             cleanup()
             throw error
@@ -175,8 +202,12 @@ class ServerManager {
 
         terminateTrackedServer(force: false)
 
+        lifecycleGeneration += 1
+        let generation = lifecycleGeneration
         DispatchQueue.global().asyncAfter(deadline: .now() + 2) { [weak self] in
-            guard let self else { return }
+            // A later start or stop owns the tracked state now; a start's
+            // stale server cleanup already reaped the process stopped here.
+            guard let self, self.lifecycleGeneration == generation else { return }
             if let processGroupID = self.processGroupID, self.isProcessGroupActive(processGroupID) {
                 self.terminateTrackedServer(force: true)
             }
@@ -349,14 +380,13 @@ class ServerManager {
     }
 
     private func serverLaunchArguments(logDirectory: URL) -> [String] {
-        let launcher = """
-        import os,sys
-        try:
-            os.setsid()
-        except PermissionError:
-            pass
-        os.execve(sys.executable, [sys.executable, '-m', 'mlx_audio.server', *sys.argv[1:]], os.environ)
-        """
+        // Run the module in this interpreter (like `python -m`) instead of
+        // exec'ing a second one, so startup pays for a single bootstrap. The
+        // launcher stays the process's command line, so keep it on one line
+        // for the `ps`-based stale server detection. setsid() only fails for
+        // a process group leader, which the pgid check skips.
+        let launcher = "import os,runpy;os.getpgid(0)==os.getpid() or os.setsid();" +
+            "runpy.run_module('mlx_audio.server',run_name='__main__',alter_sys=True)"
 
         return [
             "-c",
@@ -737,6 +767,10 @@ class ServerManager {
             ) { output in
                 Log.server.info(output)
             }
+            validationCache.record(
+                modelIdentifier,
+                fingerprint: validationFingerprint(for: modelIdentifier, pythonURL: pythonURL)
+            )
         } catch let error as ShellCommandError {
             let details = error.commandOutput
             let userFacingMessage = Constants.Models
@@ -764,16 +798,25 @@ class ServerManager {
 
     /// Check if a model exists in the local cache
     func checkModelExists(_ modelIdentifier: String) async throws -> Bool {
-        // Check in the HuggingFace cache directory
+        FileManager.default.fileExists(atPath: Self.huggingFaceCacheURL(for: modelIdentifier).path)
+    }
+
+    /// Location of a model in the HuggingFace cache directory
+    private static func huggingFaceCacheURL(for modelIdentifier: String) -> URL {
         let homeDir = FileManager.default.homeDirectoryForCurrentUser
         let cacheDir = homeDir.appendingPathComponent(".cache/huggingface/hub")
 
         // Convert model ID to cache directory format
         // e.g., "mlx-community/parakeet-tdt-0.6b-v2" -> "models--mlx-community--parakeet-tdt-0.6b-v2"
         let modelPath = "models--" + modelIdentifier.replacingOccurrences(of: "/", with: "--")
-        let fullPath = cacheDir.appendingPathComponent(modelPath)
+        return cacheDir.appendingPathComponent(modelPath)
+    }
 
-        return FileManager.default.fileExists(atPath: fullPath.path)
+    private func validationFingerprint(for modelIdentifier: String, pythonURL: URL) -> ModelValidationFingerprint? {
+        ModelValidationFingerprint.make(
+            pythonURL: pythonURL,
+            modelCacheURL: Self.huggingFaceCacheURL(for: modelIdentifier)
+        )
     }
 
     /// Download and cache a model using the existing Python environment
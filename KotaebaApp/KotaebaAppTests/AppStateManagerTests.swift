@@ -64,6 +64,29 @@ final class AppStateManagerTests: XCTestCase {
         XCTAssertEqual(manager.state, AppState.idle)
     }
 
+    func testChangingModelWhileServerRunningWaitsForStopBeforeRestart() async {
+        let originalSelectedModel = UserDefaults.standard.object(forKey: Constants.UserDefaultsKeys.selectedModel)
+        defer { restore(originalSelectedModel, forKey: Constants.UserDefaultsKeys.selectedModel) }
+
+        let mockServer = MockServerManager()
+        let manager = AppStateManager(serverManager: mockServer, shouldAutoStartServer: false)
+        await manager.startServer()
+
+        guard let otherModel = manager.availableModels.first(where: {
+            $0.identifier != manager.selectedModel.identifier
+        }) else {
+            return XCTFail("Expected a second bundled model")
+        }
+
+        await manager.setSelectedModel(otherModel)
+
+        XCTAssertTrue(mockServer.stopAndWaitCalled)
+        XCTAssertEqual(mockServer.startCallCount, 2)
+        XCTAssertEqual(mockServer.calls.filter { $0 != .stop }, [.start, .stopAndWait, .start])
+        XCTAssertEqual(manager.state, AppState.serverRunning)
+        XCTAssertEqual(manager.selectedModel.identifier, otherModel.identifier)
+    }
+
     func testRecoverablePortConflictShowsRecoveryAction() async {
         let mockServer = MockServerManager()
         mockServer.startError = ServerError.failedToStart(
@@ -247,6 +270,77 @@ final class AppStateManagerTests: XCTestCase {
         XCTAssertEqual(manager.state, AppState.idle)
     }
 
+    func testStopRecordingFlushesBatchedAudioBeforeDisconnect() async {
+        let mockAudioCapture = MockAudioCapture()
+        let mockWebSocket = MockWebSocketClient()
+        let manager = AppStateManager(
+            serverManager: MockServerManager(),
+            audioCapture: mockAudioCapture,
+            statisticsManager: MockStatisticsManager(),
+            webSocketClientFactory: { _ in mockWebSocket },
+            shouldAutoStartServer: false
+        )
+        let buffer = Data([0x01, 0x02, 0x03, 0x04])
+
+        await manager.startServer()
+        manager.startRecording()
+        manager.webSocketDidConnect(mockWebSocket)
+        await Task.yield()
+
+        guard let sessionID = mockAudioCapture.lastSessionID else {
+            return XCTFail("Expected an active capture session")
+        }
+        manager.audioCaptureDidReceiveBuffer(buffer, amplitude: 0.5, sessionID: sessionID)
+        await Task.yield()
+
+        manager.stopRecording()
+        XCTAssertEqual(mockWebSocket.audioEvents, [.send(buffer), .flush])
+
+        await manager.shutdownForTermination()
+        XCTAssertEqual(mockWebSocket.audioEvents, [.send(buffer), .flush, .disconnect])
+    }
+
+    func testCancelRecordingDropsBatchedAudio() async {
+        let mockAudioCapture = MockAudioCapture()
+        let mockWebSocket = MockWebSocketClient()
+        let manager = AppStateManager(
+            serverManager: MockServerManager(),
+            audioCapture: mockAudioCapture,
+            statisticsManager: MockStatisticsManager(),
+            webSocketClientFactory: { _ in mockWebSocket },
+            shouldAutoStartServer: false
+        )
+        let buffer = Data([0x01, 0x02, 0x03, 0x04])
+
+        await manager.startServer()
+        manager.startRecording()
+        manager.webSocketDidConnect(mockWebSocket)
+        await Task.yield()
+
+        guard let sessionID = mockAudioCapture.lastSessionID else {
+            return XCTFail("Expected an active capture session")
+        }
+        manager.audioCaptureDidReceiveBuffer(buffer, amplitude: 0.5, sessionID: sessionID)
+        await Task.yield()
+
+        manager.cancelRecording()
+
+        XCTAssertEqual(mockWebSocket.audioEvents, [.send(buffer), .disconnect])
+        manager.shutdown()
+    }
+
+    func testShutdownAfterTerminationShutdownDoesNotRepeatTeardown() async {
+        let mockServer = MockServerManager()
+        let manager = AppStateManager(serverManager: mockServer, shouldAutoStartServer: false)
+
+        await manager.startServer()
+        await manager.shutdownForTermination()
+        manager.shutdown()
+
+        XCTAssertEqual(mockServer.stopCallCount, 1)
+        XCTAssertEqual(manager.state, AppState.idle)
+    }
+
     private func restore(_ value: Any?, forKey key: String) {
         if let value {
             UserDefaults.standard.set(value, forKey: key)
@@ -257,9 +351,17 @@ final class AppStateManagerTests: XCTestCase {
 }
 
 private final class MockServerManager: ServerManaging {
+    enum Call: Equatable {
+        case start
+        case stop
+        case stopAndWait
+    }
+
     var unexpectedExitHandler: (@MainActor (String) -> Void)?
+    private(set) var calls: [Call] = []
     private(set) var startCallCount = 0
-    private(set) var stopCalled = false
+    private(set) var stopCallCount = 0
+    private(set) var stopAndWaitCalled = false
     private(set) var terminatePortConflictCalled = false
     var startError: Error?
     var inspectPortConflictResult: ServerPortConflict?
@@ -267,17 +369,23 @@ private final class MockServerManager: ServerManaging {
 
     func start(model: String, progressHandler: ServerStartupProgressHandler?) async throws {
         startCallCount += 1
+        calls.append(.start)
         if let startError {
             throw startError
         }
         progressHandler?(.launchingServer)
     }
 
+    var stopCalled: Bool { stopCallCount > 0 }
+
     func stop() {
-        stopCalled = true
+        stopCallCount += 1
+        calls.append(.stop)
     }
 
     func stopAndWait(timeout: TimeInterval) async {
+        stopAndWaitCalled = true
+        calls.append(.stopAndWait)
         stop()
     }
 
@@ -400,9 +508,16 @@ private final class MockStatisticsManager: StatisticsManaging {
 }
 
 private final class MockWebSocketClient: WebSocketClienting {
+    enum AudioEvent: Equatable {
+        case send(Data)
+        case flush
+        case disconnect
+    }
+
     weak var delegate: WebSocketClientDelegate?
     private(set) var connectCalled = false
     private(set) var disconnectCalled = false
+    private(set) var audioEvents: [AudioEvent] = []
 
     func connect() {
         connectCalled = true
@@ -410,11 +525,18 @@ private final class MockWebSocketClient: WebSocketClienting {
 
     func disconnect() {
         disconnectCalled = true
+        audioEvents.append(.disconnect)
     }
 
     func sendConfiguration(_ config: ClientConfig) {}
 
-    func sendAudioData(_ data: Data) {}
+    func sendAudioData(_ data: Data) {
+        audioEvents.append(.send(data))
+    }
+
+    func flushAudio() {
+        audioEvents.append(.flush)
+    }
 
     func sendText(_ text: String) {}
 }
@@ -423,6 +545,7 @@ private final class MockAudioCapture: AudioCapturing {
     weak var delegate: AudioCaptureDelegate?
     var inputDevicesDidChange: (() -> Void)?
     private(set) var stopRecordingCallCount = 0
+    private(set) var lastSessionID: AudioCaptureSessionID?
 
     func requestPermission() async -> Bool {
         true
@@ -433,7 +556,9 @@ private final class MockAudioCapture: AudioCapturing {
     }
 
     func startRecording() throws -> AudioCaptureSessionID {
-        AudioCaptureSessionID()
+        let sessionID = AudioCaptureSessionID()
+        lastSessionID = sessionID
+        return sessionID
     }
 
     func stopRecording() {
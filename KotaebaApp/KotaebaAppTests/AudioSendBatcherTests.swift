@@ -0,0 +1,40 @@
+import XCTest
+@testable import KotaebaApp
+
+final class AudioSendBatcherTests: XCTestCase {
+    func testHoldsBuffersUntilThresholdIsReached() {
+        var batcher = AudioSendBatcher(threshold: 8)
+
+        XCTAssertNil(batcher.append(Data([1, 2, 3])))
+        XCTAssertNil(batcher.append(Data([4, 5, 6])))
+        XCTAssertEqual(batcher.pendingByteCount, 6)
+
+        let batch = batcher.append(Data([7, 8, 9]))
+        XCTAssertEqual(batch, Data([1, 2, 3, 4, 5, 6, 7, 8, 9]))
+        XCTAssertEqual(batcher.pendingByteCount, 0)
+    }
+
+    func testFlushReturnsResidualAudioOnce() {
+        var batcher = AudioSendBatcher(threshold: 8)
+        _ = batcher.append(Data([1, 2]))
+
+        XCTAssertEqual(batcher.flush(), Data([1, 2]))
+        XCTAssertNil(batcher.flush())
+    }
+
+    func testResetDropsPendingAudio() {
+        var batcher = AudioSendBatcher(threshold: 8)
+        _ = batcher.append(Data([1, 2]))
+
+        batcher.reset()
+
+        XCTAssertEqual(batcher.pendingByteCount, 0)
+        XCTAssertNil(batcher.flush())
+    }
+
+    func testDefaultThresholdCoversSendBatchDuration() {
+        let batcher = AudioSendBatcher()
+        // 200ms of 16kHz mono Int16 PCM
+        XCTAssertEqual(batcher.threshold, 6400)
+    }
+}
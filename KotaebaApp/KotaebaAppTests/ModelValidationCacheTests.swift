@@ -0,0 +1,107 @@
+import XCTest
+@testable import KotaebaApp
+
+final class ModelValidationCacheTests: XCTestCase {
+    private var rootURL: URL!
+
+    override func setUpWithError() throws {
+        rootURL = FileManager.default.temporaryDirectory
+            .appendingPathComponent("ModelValidationCacheTests-\(UUID().uuidString)")
+        try FileManager.default.createDirectory(at: rootURL, withIntermediateDirectories: true)
+    }
+
+    override func tearDownWithError() throws {
+        try? FileManager.default.removeItem(at: rootURL)
+    }
+
+    func testFingerprintIsNilWhenModelIsNotCached() throws {
+        let pythonURL = try makeRuntime()
+
+        let fingerprint = ModelValidationFingerprint.make(
+            pythonURL: pythonURL,
+            modelCacheURL: rootURL.appendingPathComponent("models--missing")
+        )
+
+        XCTAssertNil(fingerprint)
+    }
+
+    func testFingerprintChangesWhenModelSnapshotsChange() throws {
+        let pythonURL = try makeRuntime()
+        let modelURL = try makeModelCache()
+        let snapshotsURL = modelURL.appendingPathComponent("snapshots")
+        let before = ModelValidationFingerprint.make(pythonURL: pythonURL, modelCacheURL: modelURL)
+
+        try setModificationDate(Date(timeIntervalSince1970: 2_000), of: snapshotsURL)
+        let after = ModelValidationFingerprint.make(pythonURL: pythonURL, modelCacheURL: modelURL)
+
+        XCTAssertNotNil(before)
+        XCTAssertNotEqual(before, after)
+    }
+
+    func testFingerprintChangesWhenRuntimePackagesChange() throws {
+        let pythonURL = try makeRuntime()
+        let modelURL = try makeModelCache()
+        let sitePackagesURL = rootURL.appendingPathComponent("venv/lib/python3.11/site-packages")
+        let before = ModelValidationFingerprint.make(pythonURL: pythonURL, modelCacheURL: modelURL)
+
+        try setModificationDate(Date(timeIntervalSince1970: 3_000), of: sitePackagesURL)
+        let after = ModelValidationFingerprint.make(pythonURL: pythonURL, modelCacheURL: modelURL)
+
+        XCTAssertNotEqual(before, after)
+    }
+
+    func testRecordedValidationPersistsAcrossInstances() throws {
+        let cacheURL = rootURL.appendingPathComponent("model-validation-cache.json")
+        let fingerprint = ModelValidationFingerprint.make(
+            pythonURL: try makeRuntime(),
+            modelCacheURL: try makeModelCache()
+        )
+
+        ModelValidationCache(fileURL: cacheURL).record("org/model", fingerprint: fingerprint)
+
+        let reloaded = ModelValidationCache(fileURL: cacheURL)
+        XCTAssertTrue(reloaded.isValidated("org/model", fingerprint: fingerprint))
+        XCTAssertFalse(reloaded.isValidated("org/other", fingerprint: fingerprint))
+        XCTAssertFalse(reloaded.isValidated("org/model", fingerprint: nil))
+    }
+
+    func testInvalidateForgetsModel() throws {
+        let cacheURL = rootURL.appendingPathComponent("model-validation-cache.json")
+        let fingerprint = ModelValidationFingerprint.make(
+            pythonURL: try makeRuntime(),
+            modelCacheURL: try makeModelCache()
+        )
+        let cache = ModelValidationCache(fileURL: cacheURL)
+        cache.record("org/model", fingerprint: fingerprint)
+
+        cache.invalidate("org/model")
+
+        XCTAssertFalse(cache.isValidated("org/model", fingerprint: fingerprint))
+        XCTAssertFalse(ModelValidationCache(fileURL: cacheURL).isValidated("org/model", fingerprint: fingerprint))
+    }
+
+    private func makeRuntime() throws -> URL {
+        let venvURL = rootURL.appendingPathComponent("venv")
+        let binURL = venvURL.appendingPathComponent("bin")
+        let sitePackagesURL = venvURL.appendingPathComponent("lib/python3.11/site-packages")
+        try FileManager.default.createDirectory(at: binURL, withIntermediateDirectories: true)
+        try FileManager.default.createDirectory(at: sitePackagesURL, withIntermediateDirectories: true)
+        try setModificationDate(Date(timeIntervalSince1970: 1_000), of: sitePackagesURL)
+
+        let pythonURL = binURL.appendingPathComponent("python")
+        FileManager.default.createFile(atPath: pythonURL.path, contents: Data())
+        return pythonURL
+    }
+
+    private func makeModelCache() throws -> URL {
+        let modelURL = rootURL.appendingPathComponent("models--org--model")
+        let snapshotsURL = modelURL.appendingPathComponent("snapshots")
+        try FileManager.default.createDirectory(at: snapshotsURL, withIntermediateDirectories: true)
+        try setModificationDate(Date(timeIntervalSince1970: 1_000), of: snapshotsURL)
+        return modelURL
+    }
+
+    private func setModificationDate(_ date: Date, of url: URL) throws {
+        try FileManager.default.setAttributes([.modificationDate: date], ofItemAtPath: url.path)
+    }
+}
@@ -19,6 +19,19 @@ final class ServerMessageParsingTests: XCTestCase {
         }
     }
 
+    func testTranscriptionMessageParsingFromData() {
+        let data = Data(#"{"text":"hello","is_partial":true}"#.utf8)
+
+        let message = ServerMessage(from: data)
+        switch message {
+        case .transcription(let transcription):
+            XCTAssertEqual(transcription.text, "hello")
+            XCTAssertTrue(transcription.isPartial)
+        default:
+            XCTFail("Expected transcription message")
+        }
+    }
+
     func testStatusMessageParsing() {
         let json = """
         {"status":"ready","message":"Ready to transcribe","timestamp":"2025-01-01T00:00:00Z","progress":1.0}
@@ -50,6 +63,73 @@ final class ServerMessageParsingTests: XCTestCase {
         }
     }
 
+    func testErrorKeyTakesPrecedenceOverStatus() {
+        let json = """
+        {"error":"model failed to load","status":"error","message":"model failed to load"}
+        """
+
+        let message = ServerMessage(from: json)
+        switch message {
+        case .error(let error):
+            XCTAssertEqual(error.error, "model failed to load")
+        default:
+            XCTFail("Expected error message")
+        }
+    }
+
+    func testMalformedTranscriptionIsUnknown() {
+        let json = """
+        {"text":"hello"}
+        """
+
+        let message = ServerMessage(from: json)
+        switch message {
+        case .unknown(let raw):
+            XCTAssertEqual(raw, json)
+        default:
+            XCTFail("Expected unknown message")
+        }
+    }
+
+    func testUndecodableTranscriptionFallsThroughToError() {
+        let json = """
+        {"text":null,"error":"model failed to load"}
+        """
+
+        let message = ServerMessage(from: json)
+        switch message {
+        case .error(let error):
+            XCTAssertEqual(error.error, "model failed to load")
+        default:
+            XCTFail("Expected error message")
+        }
+    }
+
+    func testUndecodableTranscriptionFallsThroughToStatus() {
+        let json = """
+        {"text":"Loading model","status":"loading","message":"Loading model"}
+        """
+
+        let message = ServerMessage(from: json)
+        switch message {
+        case .status(let status):
+            XCTAssertEqual(status.status, "loading")
+            XCTAssertEqual(status.message, "Loading model")
+        default:
+            XCTFail("Expected status message")
+        }
+    }
+
+    func testNonObjectPayloadIsUnknown() {
+        let message = ServerMessage(from: "[1, 2, 3]")
+        switch message {
+        case .unknown(let raw):
+            XCTAssertEqual(raw, "[1, 2, 3]")
+        default:
+            XCTFail("Expected unknown message")
+        }
+    }
+
     func testUnknownMessageParsing() {
         let json = """
         {"foo":"bar"}